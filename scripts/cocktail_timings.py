@@ -1,22 +1,25 @@
 import asyncio
+import csv
 import os
 from datetime import datetime
-
-from ultrai.system_readiness import check_system_readiness
-import csv
 from pathlib import Path
-from ultrai.user_input import collect_user_inputs
-from ultrai.active_llms import prepare_active_llms
-from ultrai.initial_round import execute_initial_round
-from ultrai.meta_round import execute_meta_round
-from ultrai.ultrai_synthesis import execute_ultrai_synthesis
-from ultrai.statistics import generate_statistics
+
+from ultrai._loop import run_main
 
 
 COCKTAILS = ["PREMIUM", "SPEEDY", "BUDGET", "DEPTH"]
 
 
 async def run_for_cocktail(cocktail: str):
+    # Deferred so a missing API key exits without loading the httpx stack
+    from ultrai.system_readiness import check_system_readiness
+    from ultrai.user_input import collect_user_inputs
+    from ultrai.active_llms import prepare_active_llms
+    from ultrai.initial_round import execute_initial_round
+    from ultrai.meta_round import execute_meta_round
+    from ultrai.ultrai_synthesis import execute_ultrai_synthesis
+    from ultrai.statistics import generate_statistics
+
     run_id = f"timing_{cocktail.lower()}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     await check_system_readiness(run_id=run_id)
 
@@ -59,52 +62,76 @@ async def run_with_retries(cocktail: str, attempts: int = 3):
     raise RuntimeError(f"Failed to run cocktail {cocktail} after {attempts} attempts")
 
 
+def csv_row(res: dict) -> list:
+    """Format one run_for_cocktail result as a CSV row (seconds, 2 dp)"""
+    return [
+        res['cocktail'],
+        f"{(res['initial_avg_ms'] or 0) / 1000:.2f}",
+        f"{(res['meta_avg_ms'] or 0) / 1000:.2f}",
+        f"{(res['ultrai_ms'] or 0) / 1000:.2f}",
+        res['run_id'],
+        res['initial_count'],
+        res['meta_count'],
+    ]
+
+
 async def main():
     if not os.getenv("OPENROUTER_API_KEY"):
         print("Missing OPENROUTER_API_KEY; cannot run real timing.")
         return 1
 
-    results = []
-    for c in COCKTAILS:
-        print(f"\n=== Running timing for {c} ===")
-        res = await run_with_retries(c)
-        results.append(res)
-        print(
-            f"{c}: INITIAL avg_ms={res['initial_avg_ms']} (n={res['initial_count']}), "
-            f"META avg_ms={res['meta_avg_ms']} (n={res['meta_count']}), "
-            f"ULTRAI ms={res['ultrai_ms']}"
-        )
-
-    # Write CSV
     bench_dir = Path("runs/benchmarks")
     bench_dir.mkdir(parents=True, exist_ok=True)
     csv_path = bench_dir / f"cocktail_timings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    async def settle(cocktail: str):
+        try:
+            return cocktail, await run_with_retries(cocktail)
+        except Exception as e:
+            return cocktail, e
+
+    # Cocktails are independent network-bound runs; overlap them on the loop
+    # and write each CSV row as soon as its cocktail finishes
+    print(f"\n=== Running timing for {', '.join(COCKTAILS)} ===")
+    rows = []
+    failed = []
     with open(csv_path, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(["cocktail", "initial_s", "meta_s", "ultrai_s", "run_id", "initial_count", "meta_count"])
-        for r in results:
-            init_s = r['initial_avg_ms'] / 1000 if r['initial_avg_ms'] else 0
-            meta_s = r['meta_avg_ms'] / 1000 if r['meta_avg_ms'] else 0
-            ultrai_s = r['ultrai_ms'] / 1000 if r['ultrai_ms'] else 0
-            writer.writerow([
-                r['cocktail'], f"{init_s:.2f}", f"{meta_s:.2f}", f"{ultrai_s:.2f}", r['run_id'], r['initial_count'], r['meta_count']
-            ])
+        f.flush()
+        for next_done in asyncio.as_completed([settle(c) for c in COCKTAILS]):
+            c, res = await next_done
+            if isinstance(res, Exception):
+                print(f"{c}: FAILED - {type(res).__name__}: {res}")
+                failed.append(c)
+                continue
+            print(
+                f"{c}: INITIAL avg_ms={res['initial_avg_ms']} (n={res['initial_count']}), "
+                f"META avg_ms={res['meta_avg_ms']} (n={res['meta_count']}), "
+                f"ULTRAI ms={res['ultrai_ms']}"
+            )
+            row = csv_row(res)
+            rows.append(row)
+            writer.writerow(row)
+            f.flush()
 
     print(f"\nCSV written: {csv_path}")
     print("\nSummary:")
-    for r in results:
-        init_s = r['initial_avg_ms'] / 1000 if r['initial_avg_ms'] else 0
-        meta_s = r['meta_avg_ms'] / 1000 if r['meta_avg_ms'] else 0
-        ultrai_s = r['ultrai_ms'] / 1000 if r['ultrai_ms'] else 0
+    # Reuse the formatted CSV cells rather than re-deriving seconds
+    for cocktail, init_s, meta_s, ultrai_s, run_id, _, _ in rows:
         print(
-            f"{r['cocktail']}: INITIAL {init_s:.2f}s, "
-            f"META {meta_s:.2f}s, ULTRAI {ultrai_s:.2f}s "
-            f"(run_id={r['run_id']})"
+            f"{cocktail}: INITIAL {init_s}s, "
+            f"META {meta_s}s, ULTRAI {ultrai_s}s "
+            f"(run_id={run_id})"
         )
+    if failed:
+        # Partial CSV is kept, but CI must still see the run as failed
+        print(f"\nFailed cocktails: {', '.join(failed)}")
+        return 1
     return 0
 
 
 if __name__ == "__main__":
-    exit(asyncio.run(main()))
+    exit(run_main(main()))
 
 
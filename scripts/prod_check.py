@@ -18,21 +18,25 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import sys
 from typing import Optional
 
 import httpx
 
+from ultrai._json import loads as _loads
 
-def check_backend_health(
+
+async def check_backend_health(
+    client: httpx.AsyncClient,
     backend_url: str,
     timeout_s: float = 15.0,
 ) -> tuple[bool, str]:
     try:
-        r = httpx.get(f"{backend_url}/health", timeout=timeout_s)
+        r = await client.get(f"{backend_url}/health", timeout=timeout_s)
         if r.status_code != 200:
             return False, f"HTTP {r.status_code}"
-        data = r.json()
+        data = _loads(r.content)
         if data.get("status") == "ok":
             return True, "ok"
         return False, f"Unexpected payload: {data!r}"
@@ -40,13 +44,28 @@ def check_backend_health(
         return False, f"Exception: {type(e).__name__}: {e}"
 
 
-def check_frontend_load(
+async def check_frontend_load(
+    client: httpx.AsyncClient,
     frontend_url: str,
     timeout_s: float = 15.0,
 ) -> tuple[bool, str]:
     try:
-        r = httpx.get(frontend_url, timeout=timeout_s, follow_redirects=True)
-        if r.status_code != 200:
+        # The root div sits near the top of index.html; fetch only the head
+        r = await client.get(
+            frontend_url,
+            headers={"Range": "bytes=0-4095"},
+            timeout=timeout_s,
+            follow_redirects=True,
+        )
+        if r.status_code == 206 and '<div id="root"' not in r.text:
+            r = None  # not in the first 4 KiB; check the full page
+        elif r.status_code == 416:
+            r = None
+        if r is None:
+            r = await client.get(
+                frontend_url, timeout=timeout_s, follow_redirects=True
+            )
+        if r.status_code not in (200, 206):
             return False, f"HTTP {r.status_code}"
         html = r.text
         if '<div id="root"></div>' in html or '<div id="root"' in html:
@@ -56,18 +75,19 @@ def check_frontend_load(
         return False, f"Exception: {type(e).__name__}: {e}"
 
 
-def check_artifact(
+async def check_artifact(
+    client: httpx.AsyncClient,
     backend_url: str,
     run_id: str,
     timeout_s: float = 15.0,
 ) -> tuple[bool, str]:
     try:
         url = f"{backend_url}/runs/{run_id}/artifacts/05_ultrai.json"
-        r = httpx.get(url, timeout=timeout_s)
+        r = await client.get(url, timeout=timeout_s)
         if r.status_code != 200:
             return False, f"HTTP {r.status_code}"
         # Ensure it's JSON and contains something plausible
-        data = r.json()
+        data = _loads(r.content)
         if isinstance(data, dict) and data:
             return True, "artifact ok"
         return False, "empty or non-dict JSON"
@@ -75,6 +95,42 @@ def check_artifact(
         return False, f"Exception: {type(e).__name__}: {e}"
 
 
+async def _do_checks(args: argparse.Namespace) -> int:
+    # One pooled client; the independent probes run concurrently
+    async with httpx.AsyncClient() as client:
+        checks = [
+            check_backend_health(client, args.backend_url),
+            check_frontend_load(client, args.frontend_url),
+        ]
+        if args.run_id:
+            checks.append(check_artifact(client, args.backend_url, args.run_id))
+        results = await asyncio.gather(*checks)
+
+    (be_ok, be_msg), (fe_ok, fe_msg) = results[:2]
+
+    print(
+        f"Backend /health: {'OK' if be_ok else 'FAIL'} - {be_msg}"
+    )
+    print(
+        f"Frontend load : {'OK' if fe_ok else 'FAIL'} - {fe_msg}"
+    )
+
+    rc = 0 if (be_ok and fe_ok) else 1
+
+    if args.run_id:
+        art_ok, art_msg = results[2]
+        print(
+            "Artifact 05_ultrai.json ({}): {} - {}".format(
+                args.run_id, "OK" if art_ok else "FAIL", art_msg
+            )
+        )
+        if not art_ok:
+            rc = 2 if rc == 0 else rc
+
+    return rc
+
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     parser = argparse.ArgumentParser(
         description="UltrAI production health check"
@@ -97,31 +153,7 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     args = parser.parse_args(argv)
 
-    be_ok, be_msg = check_backend_health(args.backend_url)
-    fe_ok, fe_msg = check_frontend_load(args.frontend_url)
-
-    print(
-        f"Backend /health: {'OK' if be_ok else 'FAIL'} - {be_msg}"
-    )
-    print(
-        f"Frontend load : {'OK' if fe_ok else 'FAIL'} - {fe_msg}"
-    )
-
-    rc = 0 if (be_ok and fe_ok) else 1
-
-    if args.run_id:
-        art_ok, art_msg = check_artifact(
-            args.backend_url, args.run_id
-        )
-        print(
-            "Artifact 05_ultrai.json ({}): {} - {}".format(
-                args.run_id, "OK" if art_ok else "FAIL", art_msg
-            )
-        )
-        if not art_ok:
-            rc = 2 if rc == 0 else rc
-
-    return rc
+    return asyncio.run(_do_checks(args))
 
 
 if __name__ == "__main__":
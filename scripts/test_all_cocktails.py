@@ -4,6 +4,7 @@ Test all cocktails with real API calls to measure timing performance.
 This is a REAL integration test - no mocks.
 """
 import asyncio
+import json
 import sys
 import time
 from pathlib import Path
@@ -17,20 +18,27 @@ from ultrai.user_input import collect_user_inputs
 from ultrai.active_llms import prepare_active_llms
 from ultrai.initial_round import execute_initial_round
 from ultrai.meta_round import execute_meta_round
+from ultrai._loop import run_main
 
 
-async def test_cocktail(cocktail_name: str, test_query: str):
+def write_ready_artifact(ready_result: dict, run_id: str) -> None:
+    """Reuse one readiness verdict for a new run_id (writes 00_ready.json)"""
+    runs_dir = Path("runs") / run_id
+    runs_dir.mkdir(parents=True, exist_ok=True)
+    with open(runs_dir / "00_ready.json", "w", encoding="utf-8") as f:
+        json.dump({**ready_result, "run_id": run_id}, f, indent=2)
+
+
+async def test_cocktail(cocktail_name: str, test_query: str, ready_result: dict):
     """Test a single cocktail and return timing results"""
-    print(f"\n{'='*70}")
-    print(f"Testing: {cocktail_name}")
-    print(f"{'='*70}")
+    print(f"[{cocktail_name}] Starting")
 
-    start_total = time.time()
+    start_total = time.perf_counter()
 
-    # System readiness
-    ready_result = await check_system_readiness()
-    run_id = ready_result['run_id']
-    print(f"✓ System ready - Run ID: {run_id}")
+    # System readiness is shared; only the run_id is per cocktail
+    run_id = f"{cocktail_name.lower()}_{ready_result['run_id']}"
+    write_ready_artifact(ready_result, run_id)
+    print(f"[{cocktail_name}] ✓ System ready - Run ID: {run_id}")
 
     # Collect inputs
     collect_user_inputs(
@@ -39,41 +47,40 @@ async def test_cocktail(cocktail_name: str, test_query: str):
         cocktail=cocktail_name,
         run_id=run_id
     )
-    print(f"✓ Inputs collected")
+    print(f"[{cocktail_name}] ✓ Inputs collected")
 
     # Prepare active LLMs
     active_result = prepare_active_llms(run_id)
     model_count = len(active_result['activeList'])
-    print(f"✓ Active LLMs prepared: {model_count} models")
-    print(f"  Models: {', '.join([m.split('/')[-1] for m in active_result['activeList']])}")
+    print(f"[{cocktail_name}] ✓ Active LLMs prepared: {model_count} models")
+    short_names = {m: m.rsplit('/', 1)[-1] for m in active_result['activeList']}
+    print(f"[{cocktail_name}]   Models: {', '.join(short_names.values())}")
 
     # R1 - Initial Round
-    print(f"\n🚀 R1 (INITIAL) - {model_count} models...")
-    start_r1 = time.time()
+    print(f"[{cocktail_name}] 🚀 R1 (INITIAL) - {model_count} models...")
+    start_r1 = time.perf_counter()
 
     def r1_progress(model, time_sec, total, completed):
-        short_name = model.split('/')[-1] if '/' in model else model
-        print(f"  ✓ {short_name}: {time_sec:.2f}s ({completed}/{total})")
+        print(f"[{cocktail_name}]   ✓ {short_names.get(model, model)}: {time_sec:.2f}s ({completed}/{total})")
 
     r1_result = await execute_initial_round(run_id, progress_callback=r1_progress)
-    r1_time = time.time() - start_r1
+    r1_time = time.perf_counter() - start_r1
     r1_successful = [r for r in r1_result['responses'] if not r.get('error')]
-    print(f"✓ R1 completed in {r1_time:.2f}s ({len(r1_successful)}/{model_count} successful)")
+    print(f"[{cocktail_name}] ✓ R1 completed in {r1_time:.2f}s ({len(r1_successful)}/{model_count} successful)")
 
     # R2 - Meta Round
-    print(f"\n🚀 R2 (META) - {model_count} models...")
-    start_r2 = time.time()
+    print(f"[{cocktail_name}] 🚀 R2 (META) - {model_count} models...")
+    start_r2 = time.perf_counter()
 
     def r2_progress(model, time_sec, total, completed):
-        short_name = model.split('/')[-1] if '/' in model else model
-        print(f"  ✓ {short_name}: {time_sec:.2f}s ({completed}/{total})")
+        print(f"[{cocktail_name}]   ✓ {short_names.get(model, model)}: {time_sec:.2f}s ({completed}/{total})")
 
     r2_result = await execute_meta_round(run_id, progress_callback=r2_progress)
-    r2_time = time.time() - start_r2
+    r2_time = time.perf_counter() - start_r2
     r2_successful = [r for r in r2_result['responses'] if not r.get('error')]
-    print(f"✓ R2 completed in {r2_time:.2f}s ({len(r2_successful)}/{model_count} successful)")
+    print(f"[{cocktail_name}] ✓ R2 completed in {r2_time:.2f}s ({len(r2_successful)}/{model_count} successful)")
 
-    total_time = time.time() - start_total
+    total_time = time.perf_counter() - start_total
 
     return {
         'cocktail': cocktail_name,
@@ -101,14 +108,24 @@ async def main():
     print(f"# Date: {datetime.now().isoformat()}")
     print(f"{'#'*70}")
 
-    for cocktail in cocktails:
-        try:
-            result = await test_cocktail(cocktail, test_query)
-            results.append(result)
-        except Exception as e:
-            print(f"\n✗ {cocktail} FAILED: {e}")
+    # Probe OpenRouter once; every cocktail reuses the same READY list
+    ready_result = await check_system_readiness()
+    print(f"✓ System ready - {ready_result['llm_count']} READY LLMs")
+
+    # Cocktails are independent network-bound runs; overlap them on the loop
+    outcomes = await asyncio.gather(
+        *(test_cocktail(cocktail, test_query, ready_result) for cocktail in cocktails),
+        return_exceptions=True,
+    )
+    for cocktail, outcome in zip(cocktails, outcomes):
+        if isinstance(outcome, BaseException):
+            print(f"\n✗ {cocktail} FAILED: {outcome}")
             import traceback
-            traceback.print_exc()
+            traceback.print_exception(
+                type(outcome), outcome, outcome.__traceback__
+            )
+        else:
+            results.append(outcome)
 
     # Print comparison table
     print(f"\n{'='*70}")
@@ -131,4 +148,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_main(main())
@@ -1,7 +1,6 @@
 """
 Quick test of new LUXE cocktail to verify speed improvement.
 """
-import asyncio
 import sys
 import time
 from pathlib import Path
@@ -12,6 +11,7 @@ from ultrai.system_readiness import check_system_readiness
 from ultrai.user_input import collect_user_inputs
 from ultrai.active_llms import prepare_active_llms
 from ultrai.initial_round import execute_initial_round
+from ultrai._loop import run_main
 
 
 async def test_luxe():
@@ -20,7 +20,7 @@ async def test_luxe():
     print("TESTING NEW LUXE CONFIGURATION")
     print("="*70)
 
-    start_total = time.time()
+    start_total = time.perf_counter()
 
     # System readiness
     ready_result = await check_system_readiness()
@@ -38,6 +38,7 @@ async def test_luxe():
     # Prepare active LLMs
     active_result = prepare_active_llms(run_id)
     model_count = len(active_result['activeList'])
+    short_names = {m: m.rsplit('/', 1)[-1] for m in active_result['activeList']}
     print(f"✓ Active LLMs prepared: {model_count} models")
     print(f"\nModels:")
     for model in active_result['activeList']:
@@ -45,14 +46,13 @@ async def test_luxe():
 
     # R1 - Initial Round
     print(f"\n🚀 R1 (INITIAL) - Executing with {model_count} models...")
-    start_r1 = time.time()
+    start_r1 = time.perf_counter()
 
     def progress(model, time_sec, total, completed):
-        short_name = model.split('/')[-1] if '/' in model else model
-        print(f"  ✓ {short_name}: {time_sec:.2f}s ({completed}/{total})")
+        print(f"  ✓ {short_names.get(model, model)}: {time_sec:.2f}s ({completed}/{total})")
 
     r1_result = await execute_initial_round(run_id, progress_callback=progress)
-    r1_time = time.time() - start_r1
+    r1_time = time.perf_counter() - start_r1
 
     successful = [r for r in r1_result['responses'] if not r.get('error')]
     errors = [r for r in r1_result['responses'] if r.get('error')]
@@ -64,7 +64,7 @@ async def test_luxe():
         for err in errors:
             print(f"    - {err['model']}: {err['text']}")
 
-    total_time = time.time() - start_total
+    total_time = time.perf_counter() - start_total
 
     print(f"\n" + "="*70)
     print(f"TOTAL TIME: {total_time:.2f}s")
@@ -85,4 +85,4 @@ async def test_luxe():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_luxe())
+    run_main(test_luxe())
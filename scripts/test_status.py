@@ -6,11 +6,15 @@ Shows test progression across all PR phases with color-coded pass/fail indicator
 Run with: python scripts/test_status.py or make test-summary
 """
 
+import contextlib
+import io
 import subprocess
 import sys
 import json
 from typing import Dict, List, Tuple
 
+import pytest
+
 
 # ANSI color codes
 GREEN = '\033[92m'
@@ -20,6 +24,20 @@ BLUE = '\033[94m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# Test file -> PR phase it covers (Future PRs will be added here)
+FILE_TO_PR = {
+    'test_repo_structure.py': 'pr00',
+    'test_system_readiness.py': 'pr01',
+    'test_user_input.py': 'pr02',
+    'test_active_llms.py': 'pr03',
+    'test_initial_round.py': 'pr04',
+    'test_meta_round.py': 'pr05',
+    'test_ultrai_synthesis.py': 'pr06',
+    'test_statistics.py': 'pr08',
+    'test_final_delivery.py': 'pr09',
+    'test_fallback_logic.py': 'pr10',
+}
+
 
 def run_pytest_collect() -> Dict[str, List[str]]:
     """Collect all tests and group by PR marker"""
@@ -34,15 +52,14 @@ def run_pytest_collect() -> Dict[str, List[str]]:
         # Parse output to extract test names
         tests_by_pr = {f'pr{i:02d}': [] for i in range(11)}  # pr00 to pr10
 
-        for line in result.stdout.split('\n'):
+        for line in result.stdout.splitlines():
             if '::test_' in line:
                 test_name = line.strip()
-                # Try to determine which PR this test belongs to based on file/markers
-                if 'test_repo_structure.py' in test_name:
-                    tests_by_pr['pr00'].append(test_name)
-                elif 'test_system_readiness.py' in test_name:
-                    tests_by_pr['pr01'].append(test_name)
-                # Future PRs will be added here
+                # Determine which PR this test belongs to from its file name
+                file_name = test_name.partition('::')[0].rpartition('/')[2]
+                pr = FILE_TO_PR.get(file_name)
+                if pr:
+                    tests_by_pr[pr].append(test_name)
 
         return tests_by_pr
     except subprocess.CalledProcessError as e:
@@ -50,24 +67,43 @@ def run_pytest_collect() -> Dict[str, List[str]]:
         return {}
 
 
-def run_pytest_for_marker(marker: str) -> Tuple[int, int, int]:
-    """Run tests for a specific marker and return (passed, failed, skipped)"""
-    try:
-        result = subprocess.run(
-            ['pytest', '-m', marker, '-v', '--tb=no', '--color=no', '-q'],
-            capture_output=True,
-            text=True
-        )
+class MarkerTally:
+    """pytest plugin that tallies (passed, failed, skipped) per PR marker"""
 
-        # Parse output to count results
-        output = result.stdout + result.stderr
-        passed = output.count(' PASSED')
-        failed = output.count(' FAILED')
-        skipped = output.count(' SKIPPED')
+    def __init__(self, markers: List[str]):
+        self.counts = {marker: [0, 0, 0] for marker in markers}
 
-        return (passed, failed, skipped)
-    except Exception as e:
-        return (0, 0, 0)
+    def pytest_runtest_logreport(self, report):
+        # One outcome per test: the call phase, or setup/teardown if they didn't pass
+        if report.when == 'call' or not report.passed:
+            if report.when == 'teardown' and not report.failed:
+                return
+            index = 0 if report.passed else 1 if report.failed else 2
+            for marker, counts in self.counts.items():
+                if marker in report.keywords:
+                    counts[index] += 1
+
+
+def run_pytest_for_markers(markers: List[str]) -> Dict[str, Tuple[int, int, int]]:
+    """Run tests for all markers in one in-process pytest session.
+
+    Returns a mapping of marker -> (passed, failed, skipped).
+    """
+    tally = MarkerTally(markers)
+    try:
+        # Counts come from the plugin, not the terminal report: drop the
+        # verbose addopts (-v, -ra, --showlocals) so pytest writes as little
+        # as possible, and swallow what remains
+        with contextlib.redirect_stdout(io.StringIO()):
+            pytest.main(
+                ['-o', 'addopts=', '--strict-markers',
+                 '-m', ' or '.join(markers), '--tb=no', '--color=no', '-q',
+                 '--no-header', '-p', 'no:cacheprovider'],
+                plugins=[tally],
+            )
+    except Exception:
+        pass
+    return {marker: tuple(counts) for marker, counts in tally.counts.items()}
 
 
 def format_status(passed: int, failed: int, skipped: int, total: int) -> str:
@@ -114,8 +150,10 @@ def main():
     total_skipped = 0
     total_tests = 0
 
+    results = run_pytest_for_markers([marker for marker, _ in pr_phases])
+
     for marker, description in pr_phases:
-        passed, failed, skipped = run_pytest_for_marker(marker)
+        passed, failed, skipped = results[marker]
         total = passed + failed + skipped
 
         total_passed += passed
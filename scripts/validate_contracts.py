@@ -7,15 +7,16 @@ Currently validates only /health using contracts/api/health.contract.json.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
 import httpx
 
+from ultrai._json import loads as _loads
+
 
 def load_contract(path: Path) -> Dict[str, Any]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _loads(path.read_bytes())
 
 
 def validate_response_against_contract(
@@ -58,16 +59,14 @@ def main() -> int:
 
     # Call backend /health (default prod URL)
     backend_url = "https://ultrai-jff.onrender.com"
-    r = httpx.get(
-        f"{backend_url}/health",
-        timeout=10.0,
-    )
+    with httpx.Client(timeout=10.0) as client:
+        r = client.get(f"{backend_url}/health")
     expected = contract.get("response", {}).get("status", 200)
     if r.status_code != expected:
         print(f"/health returned HTTP {r.status_code}")
         return 2
 
-    ok, msg = validate_response_against_contract(r.json(), contract)
+    ok, msg = validate_response_against_contract(_loads(r.content), contract)
     if not ok:
         print(f"/health contract validation failed: {msg}")
         return 3
@@ -4,10 +4,22 @@ import httpx
 import asyncio
 import time
 
+from ultrai._loop import run_main
+
 BACKEND_URL = "https://ultrai-jff.onrender.com"
 
+try:
+    import h2  # noqa: F401  (httpx[http2]) multiplexes polls on one connection
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
 async def test_production():
-    async with httpx.AsyncClient(timeout=300.0) as client:
+    async with httpx.AsyncClient(
+        timeout=300.0,
+        http2=HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=10),
+    ) as client:
         # 1. Test health
         print("Testing backend health...")
         health = await client.get(f"{BACKEND_URL}/health")
@@ -32,20 +44,34 @@ async def test_production():
 
         # 3. Poll for completion
         print("\nPolling for completion...")
-        start = time.time()
-        while time.time() - start < 180:
-            status = await client.get(f"{BACKEND_URL}/runs/{run_id}/status")
+        start = time.perf_counter()
+        delay = 1.0  # backoff: 1s, 1.5s, 2.25s ... capped at 10s
+        last_update = None
+        while time.perf_counter() - start < 180:
+            # Long-poll: the server holds the request until progress changes
+            status = await client.get(
+                f"{BACKEND_URL}/runs/{run_id}/status",
+                params={"wait": 30},
+                timeout=35.0,
+            )
             status_data = status.json()
             print(f"Status: {status_data}")
 
             if status_data.get("completed"):
-                print(f"\n✅ COMPLETED in {time.time() - start:.1f}s")
+                print(f"\n✅ COMPLETED in {time.perf_counter() - start:.1f}s")
                 return
 
-            await asyncio.sleep(5)
+            # Poll again right away on progress; back off if nothing changed
+            # (e.g. a backend without ?wait= support answered immediately)
+            if status_data.get("last_update") != last_update:
+                last_update = status_data.get("last_update")
+                delay = 1.0
+                continue
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 10.0)
 
-        print(f"\n❌ TIMEOUT after {time.time() - start:.1f}s")
+        print(f"\n❌ TIMEOUT after {time.perf_counter() - start:.1f}s")
         print(f"Last status: {status_data}")
 
 if __name__ == "__main__":
-    asyncio.run(test_production())
+    run_main(test_production())
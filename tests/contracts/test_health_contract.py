@@ -10,7 +10,7 @@ def test_health_matches_contract():
     contract_path = Path("contracts/api/health.contract.json")
     assert contract_path.exists(), "health.contract.json missing"
 
-    contract = json.loads(contract_path.read_text(encoding="utf-8"))
+    contract = json.loads(contract_path.read_bytes())
     expected_status = contract.get("response", {}).get("status", 200)
 
     with TestClient(app) as client:
@@ -5,16 +5,24 @@ Tests are categorized by execution time into different timeout classes
 instead of failing on timeout, allowing for optimization and analysis.
 """
 
+import bisect
 import pytest
 import time
+from collections import defaultdict
 from typing import List, Dict, Any
 from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(frozen=True)
 class TimeoutResult:
     """Result of a test that timed out"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = (
+        'test_name', 'timeout_duration', 'timeout_reason',
+        'test_file', 'timestamp', 'timeout_class',
+    )
+
     test_name: str
     timeout_duration: float
     timeout_reason: str
@@ -37,6 +45,10 @@ class MultiTierTimeoutSystem:
     - TO_60: Full integration (30-60 seconds)
     - TO_120: Complex integration (60-120 seconds)
     """
+
+    # Upper bounds (inclusive) of every class but the last, in class order
+    _CLASS_BOUNDS = (5.0, 15.0, 30.0, 60.0)
+    _CLASS_NAMES = ('TO_5', 'TO_15', 'TO_30', 'TO_60', 'TO_120')
     
     def __init__(self):
         self.timeout_results: List[TimeoutResult] = []
@@ -48,6 +60,8 @@ class MultiTierTimeoutSystem:
             'TO_120': 120.0
         }
         self.current_threshold = 15.0  # Default threshold
+        # Rendered get_timeout_summary(); reset whenever results change
+        self._summary_cache = None
     
     def set_threshold(self, threshold: str):
         """Set the current timeout threshold"""
@@ -71,19 +85,11 @@ class MultiTierTimeoutSystem:
             timeout_class=timeout_class
         )
         self.timeout_results.append(result)
+        self._summary_cache = None
     
     def _classify_timeout(self, duration: float) -> str:
         """Classify timeout duration into appropriate class"""
-        if duration <= 5.0:
-            return 'TO_5'
-        elif duration <= 15.0:
-            return 'TO_15'
-        elif duration <= 30.0:
-            return 'TO_30'
-        elif duration <= 60.0:
-            return 'TO_60'
-        else:
-            return 'TO_120'
+        return self._CLASS_NAMES[bisect.bisect_left(self._CLASS_BOUNDS, duration)]
     
     def get_timeout_tests(self) -> List[TimeoutResult]:
         """Get all tests that timed out"""
@@ -91,93 +97,112 @@ class MultiTierTimeoutSystem:
     
     def get_timeout_tests_by_class(self) -> Dict[str, List[TimeoutResult]]:
         """Group timeout tests by timeout class"""
-        by_class = {}
+        by_class = defaultdict(list)
         for result in self.timeout_results:
-            if result.timeout_class not in by_class:
-                by_class[result.timeout_class] = []
             by_class[result.timeout_class].append(result)
-        return by_class
+        return dict(by_class)
     
     def get_timeout_tests_by_file(self) -> Dict[str, List[TimeoutResult]]:
         """Group timeout tests by file"""
-        by_file = {}
+        by_file = defaultdict(list)
         for result in self.timeout_results:
-            if result.test_file not in by_file:
-                by_file[result.test_file] = []
             by_file[result.test_file].append(result)
-        return by_file
+        return dict(by_file)
     
     def get_timeout_summary(self) -> str:
         """Get a comprehensive summary of all timeout tests"""
         if not self.timeout_results:
             return "No tests timed out - all tests completed within thresholds"
+        if self._summary_cache is not None:
+            return self._summary_cache
         
-        summary = f"Multi-Tier Timeout Analysis: {len(self.timeout_results)} tests categorized\n"
-        summary += "=" * 60 + "\n"
+        lines = [
+            f"Multi-Tier Timeout Analysis: {len(self.timeout_results)} tests categorized",
+            "=" * 60,
+        ]
         
         by_class = self.get_timeout_tests_by_class()
-        for timeout_class in ['TO_5', 'TO_15', 'TO_30', 'TO_60', 'TO_120']:
+        for timeout_class in self._CLASS_NAMES:
             if timeout_class in by_class:
                 results = by_class[timeout_class]
-                summary += f"\n{timeout_class} Class ({len(results)} tests):\n"
-                for result in results:
-                    summary += f"  - {result.test_name} ({result.timeout_duration:.1f}s)\n"
+                lines.append(f"\n{timeout_class} Class ({len(results)} tests):")
+                lines.extend(
+                    f"  - {result.test_name} ({result.timeout_duration:.1f}s)"
+                    for result in results
+                )
         
-        summary += f"\nBy File:\n"
+        lines.append("\nBy File:")
         by_file = self.get_timeout_tests_by_file()
         for file_path, results in by_file.items():
-            summary += f"\n{file_path}:\n"
-            for result in results:
-                summary += f"  - {result.timeout_class}: {result.test_name} ({result.timeout_duration:.1f}s)\n"
+            lines.append(f"\n{file_path}:")
+            lines.extend(
+                f"  - {result.timeout_class}: {result.test_name} ({result.timeout_duration:.1f}s)"
+                for result in results
+            )
         
-        return summary
+        lines.append("")
+        self._summary_cache = "\n".join(lines)
+        return self._summary_cache
     
     def get_optimization_recommendations(self) -> str:
         """Get recommendations for optimizing timed-out tests"""
-        recommendations = "Optimization Recommendations:\n"
-        recommendations += "=" * 40 + "\n"
+        lines = ["Optimization Recommendations:", "=" * 40]
         
         by_class = self.get_timeout_tests_by_class()
         
         if 'TO_5' in by_class:
-            recommendations += "\nTO_5 Tests (Unit Tests):\n"
-            recommendations += "- These should be instant - check for infinite loops\n"
-            recommendations += "- Consider mocking external dependencies\n"
+            lines.extend([
+                "\nTO_5 Tests (Unit Tests):",
+                "- These should be instant - check for infinite loops",
+                "- Consider mocking external dependencies",
+            ])
         
         if 'TO_15' in by_class:
-            recommendations += "\nTO_15 Tests (Fast Integration):\n"
-            recommendations += "- Optimize file I/O operations\n"
-            recommendations += "- Use faster test data or smaller datasets\n"
+            lines.extend([
+                "\nTO_15 Tests (Fast Integration):",
+                "- Optimize file I/O operations",
+                "- Use faster test data or smaller datasets",
+            ])
         
         if 'TO_30' in by_class:
-            recommendations += "\nTO_30 Tests (Medium Integration):\n"
-            recommendations += "- Consider using test API keys with higher rate limits\n"
-            recommendations += "- Implement request caching for repeated calls\n"
+            lines.extend([
+                "\nTO_30 Tests (Medium Integration):",
+                "- Consider using test API keys with higher rate limits",
+                "- Implement request caching for repeated calls",
+            ])
         
         if 'TO_60' in by_class:
-            recommendations += "\nTO_60 Tests (Full Integration):\n"
-            recommendations += "- Break down into smaller integration tests\n"
-            recommendations += "- Use parallel execution where possible\n"
+            lines.extend([
+                "\nTO_60 Tests (Full Integration):",
+                "- Break down into smaller integration tests",
+                "- Use parallel execution where possible",
+            ])
         
         if 'TO_120' in by_class:
-            recommendations += "\nTO_120 Tests (Complex Integration):\n"
-            recommendations += "- These may be legitimate stress tests\n"
-            recommendations += "- Consider running separately from CI\n"
-            recommendations += "- Use dedicated test environment\n"
+            lines.extend([
+                "\nTO_120 Tests (Complex Integration):",
+                "- These may be legitimate stress tests",
+                "- Consider running separately from CI",
+                "- Use dedicated test environment",
+            ])
         
-        return recommendations
+        lines.append("")
+        return "\n".join(lines)
     
     def clear(self):
         """Clear all timeout results"""
         self.timeout_results.clear()
+        self._summary_cache = None
     
     def save_to_file(self, file_path: str = "timeout_analysis.txt"):
         """Save timeout results and recommendations to a file"""
+        content = (
+            f"{self.get_timeout_summary()}\n\n"
+            f"{self.get_optimization_recommendations()}\n"
+            f"Generated at: {time.ctime()}\n"
+        )
         with open(file_path, "w") as f:
-            f.write(self.get_timeout_summary())
-            f.write("\n\n")
-            f.write(self.get_optimization_recommendations())
-            f.write(f"\nGenerated at: {time.ctime()}\n")
+            f.write(content)
     
     def __len__(self):
         return len(self.timeout_results)
@@ -189,28 +214,22 @@ class MultiTierTimeoutSystem:
 # Global instance for tracking timeouts
 timeout_system = MultiTierTimeoutSystem()
 
+# Rule framing the end-of-session timeout report
+_RULE = "=" * 70
 
-def pytest_runtest_setup(item):
-    """Pytest hook to track test start time"""
-    item._start_time = time.time()
-
-
-def pytest_runtest_teardown(item, nextitem):
-    """Pytest hook to check for timeouts and categorize them"""
-    if hasattr(item, '_start_time'):
-        duration = time.time() - item._start_time
-        if duration > timeout_system.current_threshold:
-            # Test took longer than threshold - add to appropriate timeout class
-            test_name = item.name
-            test_file = str(item.fspath)
-            timeout_reason = f"Test execution exceeded {timeout_system.current_threshold}s threshold"
-            
-            timeout_system.add_timeout(
-                test_name=test_name,
-                timeout_duration=duration,
-                timeout_reason=timeout_reason,
-                test_file=test_file
-            )
+
+def pytest_runtest_logreport(report):
+    """Pytest hook to categorize slow tests from pytest's own call timing"""
+    if report.when == "call" and report.duration > timeout_system.current_threshold:
+        # Test took longer than threshold - add to appropriate timeout class
+        timeout_reason = f"Test execution exceeded {timeout_system.current_threshold}s threshold"
+        
+        timeout_system.add_timeout(
+            test_name=report.nodeid.rpartition('::')[2],
+            timeout_duration=report.duration,
+            timeout_reason=timeout_reason,
+            test_file=report.fspath
+        )
 
 
 def pytest_timeout_setup(item):
@@ -225,7 +244,8 @@ def pytest_timeout_teardown(item):
     # This is called after pytest-timeout has killed the test
     # We can categorize it here
     test_name = item.name
-    test_file = str(item.fspath)
+    # Same rootdir-relative form as report.fspath in pytest_runtest_logreport
+    test_file = item.nodeid.partition('::')[0]
     timeout_duration = timeout_system.current_threshold  # Approximate duration
     timeout_reason = f"Test killed by pytest-timeout after {timeout_duration}s"
     
@@ -240,15 +260,15 @@ def pytest_timeout_teardown(item):
 def pytest_sessionfinish(session, exitstatus):
     """Pytest hook to report timeout results at the end"""
     if timeout_system.timeout_results:
-        print("\n" + "="*70)
+        print("\n" + _RULE)
         print("MULTI-TIER TIMEOUT ANALYSIS - Tests Categorized for Optimization")
-        print("="*70)
+        print(_RULE)
         print(timeout_system.get_timeout_summary())
         print("\n" + timeout_system.get_optimization_recommendations())
         timeout_system.save_to_file()
         print(f"\nDetailed analysis saved to: timeout_analysis.txt")
         print("These tests did not fail - they are categorized for optimization.")
-        print("="*70)
+        print(_RULE)
 
 
 # Decorator for marking tests that should be categorized if they timeout
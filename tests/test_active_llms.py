@@ -13,6 +13,7 @@ import pytest
 from pathlib import Path
 from ultrai.active_llms import (
     prepare_active_llms,
+    prepare_active_llms_from,
     load_active_llms,
     ActiveLLMError,
     COCKTAIL_MODELS,
@@ -20,86 +21,70 @@ from ultrai.active_llms import (
 )
 
 
+def make_run(run_id, ready_list=None, cocktail=None, query="Test query"):
+    """Create runs/<run_id>/ with 00_ready.json and/or 01_inputs.json"""
+    runs_dir = Path("runs") / run_id
+    runs_dir.mkdir(parents=True)
+    if ready_list is not None:
+        (runs_dir / "00_ready.json").write_text(json.dumps({
+            "run_id": run_id,
+            "readyList": ready_list,
+            "status": "READY"
+        }))
+    if cocktail is not None:
+        (runs_dir / "01_inputs.json").write_text(json.dumps({
+            "QUERY": query,
+            "ANALYSIS": "Synthesis",
+            "COCKTAIL": cocktail,
+        }))
+    return runs_dir
+
+
 def test_02_activate_json_exists(tmp_path, monkeypatch):
     """Test that 02_activate.json artifact is created"""
     monkeypatch.chdir(tmp_path)
 
     # Create prerequisite artifacts
     run_id = "test_run_001"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
-    # Create 00_ready.json with sample READY list (includes 2+ PREMIUM PRIMARY models)
-    ready_data = {
-        "run_id": run_id,
-        "readyList": [
+    # Sample READY list (includes 2+ PREMIUM PRIMARY models), PREMIUM cocktail
+    runs_dir = make_run(
+        run_id,
+        ready_list=[
             "anthropic/claude-3.7-sonnet",  # PREMIUM PRIMARY
             "openai/gpt-4o",  # PREMIUM PRIMARY
             "google/gemini-2.5-pro",  # PREMIUM PRIMARY
             "openai/gpt-4o-mini",
             "meta-llama/llama-3.3-70b-instruct"
         ],
-        "status": "READY"
-    }
-    with open(runs_dir / "00_ready.json", "w") as f:
-        json.dump(ready_data, f)
-
-    # Create 01_inputs.json with PREMIUM cocktail
-    inputs_data = {
-        "QUERY": "Test query",
-        "ANALYSIS": "Synthesis",
-        "COCKTAIL": "PREMIUM",
-    }
-    with open(runs_dir / "01_inputs.json", "w") as f:
-        json.dump(inputs_data, f)
+        cocktail="PREMIUM",
+        query="Test query",
+    )
 
     # Execute active LLMs preparation
-    prepare_active_llms(run_id)
+    result = prepare_active_llms(run_id)
 
     # Verify artifact exists
     artifact_path = runs_dir / "02_activate.json"
     assert artifact_path.exists(), "02_activate.json artifact must exist"
 
-    # Verify artifact can be parsed
-    with open(artifact_path, "r") as f:
-        artifact_data = json.load(f)
-
-    assert artifact_data is not None
-    assert "activeList" in artifact_data
-    assert "quorum" in artifact_data
+    # The returned dict is what was written; parsing the file back is
+    # covered by test_load_active_llms
+    assert "activeList" in result
+    assert "quorum" in result
 
 
-def test_active_gte_2_quorum_2(tmp_path, monkeypatch):
+def test_active_gte_2_quorum_2():
     """Test that activeList has at least 2 models and quorum is 2"""
-    monkeypatch.chdir(tmp_path)
-
-    run_id = "test_run_002"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
-    # Create READY list with all 3 SPEEDY PRIMARY models
-    ready_data = {
-        "run_id": run_id,
-        "readyList": [
+    # READY list with all 3 SPEEDY PRIMARY models
+    result = prepare_active_llms_from(
+        [
             "openai/gpt-4o-mini",  # SPEEDY PRIMARY
             "anthropic/claude-3-haiku",  # SPEEDY PRIMARY
             "x-ai/grok-3-mini",  # SPEEDY PRIMARY (updated)
             "openai/gpt-4o"  # Not in SPEEDY
         ],
-        "status": "READY"
-    }
-    with open(runs_dir / "00_ready.json", "w") as f:
-        json.dump(ready_data, f)
-
-    inputs_data = {
-        "QUERY": "Test query",
-        "ANALYSIS": "Synthesis",
-        "COCKTAIL": "SPEEDY",
-    }
-    with open(runs_dir / "01_inputs.json", "w") as f:
-        json.dump(inputs_data, f)
-
-    result = prepare_active_llms(run_id)
+        "SPEEDY",
+    )
 
     # Verify quorum
     assert result["quorum"] == 2, "Quorum must be 2"
@@ -110,92 +95,50 @@ def test_active_gte_2_quorum_2(tmp_path, monkeypatch):
     assert len(result["activeList"]) == 3, "Expected 3 ACTIVE models for this test"
 
 
-def test_all_four_cocktails(tmp_path, monkeypatch):
-    """Test ACTIVE selection for all 4 cocktails"""
-    monkeypatch.chdir(tmp_path)
-
-    # Create a comprehensive READY list with all PRIMARY models
-    ready_list = [
-        "openai/gpt-4o",
-        "openai/chatgpt-4o-latest",
-        "openai/gpt-4o-mini",
-        "openai/gpt-3.5-turbo",
-        "anthropic/claude-3.7-sonnet",
-        "anthropic/claude-3-haiku",  # Updated from claude-3.5-haiku
-        "anthropic/claude-sonnet-4.5",
-        "google/gemini-2.0-flash-exp:free",
-        "google/gemini-2.5-pro",
-        "meta-llama/llama-3.3-70b-instruct",
-        "qwen/qwen-2.5-72b-instruct",
-        "x-ai/grok-2-1212"
-    ]
-
-    cocktails = ["PREMIUM", "SPEEDY", "BUDGET", "DEPTH"]
-
-    for i, cocktail in enumerate(cocktails):
-        run_id = f"test_run_00{i+3}"
-        runs_dir = Path(f"runs/{run_id}")
-        runs_dir.mkdir(parents=True)
-
-        ready_data = {
-            "run_id": run_id,
-            "readyList": ready_list,
-            "status": "READY"
-        }
-        with open(runs_dir / "00_ready.json", "w") as f:
-            json.dump(ready_data, f)
-
-        inputs_data = {
-            "QUERY": f"Test query for {cocktail}",
-            "ANALYSIS": "Synthesis",
-            "COCKTAIL": cocktail,
-        }
-        with open(runs_dir / "01_inputs.json", "w") as f:
-            json.dump(inputs_data, f)
-
-        result = prepare_active_llms(run_id)
-
-        # Verify results
-        assert result["cocktail"] == cocktail
-        assert len(result["activeList"]) >= 2, f"{cocktail} must have at least 2 ACTIVE"
-        assert result["quorum"] == 2
-
-        # Verify all active models are from the cocktail
-        cocktail_models = COCKTAIL_MODELS[cocktail]
-        for model in result["activeList"]:
-            assert model in cocktail_models, f"{model} not in {cocktail} definition"
-
-
-def test_intersection_logic(tmp_path, monkeypatch):
+# Comprehensive READY list containing every cocktail's PRIMARY models
+ALL_READY = [
+    "openai/gpt-4o",
+    "openai/chatgpt-4o-latest",
+    "openai/gpt-4o-mini",
+    "openai/gpt-3.5-turbo",
+    "anthropic/claude-3.7-sonnet",
+    "anthropic/claude-3-haiku",  # Updated from claude-3.5-haiku
+    "anthropic/claude-sonnet-4.5",
+    "google/gemini-2.0-flash-exp:free",
+    "google/gemini-2.5-pro",
+    "meta-llama/llama-3.3-70b-instruct",
+    "qwen/qwen-2.5-72b-instruct",
+    "x-ai/grok-2-1212"
+]
+
+
+@pytest.mark.parametrize("cocktail", ["PREMIUM", "SPEEDY", "BUDGET", "DEPTH"])
+def test_all_four_cocktails(cocktail):
+    """Test ACTIVE selection for each of the 4 cocktails"""
+    result = prepare_active_llms_from(ALL_READY, cocktail)
+
+    # Verify results
+    assert result["cocktail"] == cocktail
+    assert len(result["activeList"]) >= 2, f"{cocktail} must have at least 2 ACTIVE"
+    assert result["quorum"] == 2
+
+    # Verify all active models are from the cocktail
+    cocktail_models = COCKTAIL_MODELS[cocktail]
+    for model in result["activeList"]:
+        assert model in cocktail_models, f"{model} not in {cocktail} definition"
+
+
+def test_intersection_logic():
     """Test that ACTIVE = READY ∩ COCKTAIL"""
-    monkeypatch.chdir(tmp_path)
-
-    run_id = "test_run_007"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
     # Only 2 out of 3 PREMIUM models are READY
-    ready_data = {
-        "run_id": run_id,
-        "readyList": [
+    result = prepare_active_llms_from(
+        [
             "anthropic/claude-3.7-sonnet",  # PREMIUM PRIMARY
             "openai/gpt-4o",  # PREMIUM PRIMARY
             "openai/gpt-3.5-turbo"  # Not in PREMIUM PRIMARY
         ],
-        "status": "READY"
-    }
-    with open(runs_dir / "00_ready.json", "w") as f:
-        json.dump(ready_data, f)
-
-    inputs_data = {
-        "QUERY": "Test intersection",
-        "ANALYSIS": "Synthesis",
-        "COCKTAIL": "PREMIUM",
-    }
-    with open(runs_dir / "01_inputs.json", "w") as f:
-        json.dump(inputs_data, f)
-
-    result = prepare_active_llms(run_id)
+        "PREMIUM",
+    )
 
     # Should only have the intersection of READY and PREMIUM PRIMARY
     assert len(result["activeList"]) == 2
@@ -205,31 +148,12 @@ def test_intersection_logic(tmp_path, monkeypatch):
     assert "openai/gpt-3.5-turbo" not in result["activeList"]  # Not in PREMIUM
 
 
-def test_reasons_field(tmp_path, monkeypatch):
+def test_reasons_field():
     """Test that reasons field explains status of each cocktail model"""
-    monkeypatch.chdir(tmp_path)
-
-    run_id = "test_run_008"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
-    ready_data = {
-        "run_id": run_id,
-        "readyList": ["openai/gpt-4o", "anthropic/claude-3.7-sonnet"],
-        "status": "READY"
-    }
-    with open(runs_dir / "00_ready.json", "w") as f:
-        json.dump(ready_data, f)
-
-    inputs_data = {
-        "QUERY": "Test reasons",
-        "ANALYSIS": "Synthesis",
-        "COCKTAIL": "PREMIUM",
-    }
-    with open(runs_dir / "01_inputs.json", "w") as f:
-        json.dump(inputs_data, f)
-
-    result = prepare_active_llms(run_id)
+    result = prepare_active_llms_from(
+        ["openai/gpt-4o", "anthropic/claude-3.7-sonnet"],
+        "PREMIUM",
+    )
 
     # Verify reasons dictionary exists
     assert "reasons" in result
@@ -246,34 +170,11 @@ def test_reasons_field(tmp_path, monkeypatch):
     assert reasons["google/gemini-2.5-pro"] == "NOT READY"
 
 
-def test_insufficient_active_raises_error(tmp_path, monkeypatch):
+def test_insufficient_active_raises_error():
     """Test error when activeList < 2 (quorum not met)"""
-    monkeypatch.chdir(tmp_path)
-
-    run_id = "test_run_009"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
-    # Only 1 BUDGET model is READY
-    ready_data = {
-        "run_id": run_id,
-        "readyList": ["openai/gpt-3.5-turbo"],  # Only one BUDGET model
-        "status": "READY"
-    }
-    with open(runs_dir / "00_ready.json", "w") as f:
-        json.dump(ready_data, f)
-
-    inputs_data = {
-        "QUERY": "Test insufficient",
-        "ANALYSIS": "Synthesis",
-        "COCKTAIL": "BUDGET",
-    }
-    with open(runs_dir / "01_inputs.json", "w") as f:
-        json.dump(inputs_data, f)
-
-    # Should raise error
+    # Only 1 BUDGET model is READY; should raise error
     with pytest.raises(ActiveLLMError) as exc_info:
-        prepare_active_llms(run_id)
+        prepare_active_llms_from(["openai/gpt-3.5-turbo"], "BUDGET")
 
     error_message = str(exc_info.value)
     assert "Insufficient ACTIVE LLMs" in error_message
@@ -281,50 +182,25 @@ def test_insufficient_active_raises_error(tmp_path, monkeypatch):
     assert "need at least 2" in error_message
 
 
-def test_missing_ready_json_raises_error(tmp_path, monkeypatch):
-    """Test error when 00_ready.json is missing"""
+@pytest.mark.parametrize("present,missing_msg", [
+    ("01_inputs.json", "Missing 00_ready.json"),
+    ("00_ready.json", "Missing 01_inputs.json"),
+])
+def test_missing_prerequisite_raises_error(tmp_path, monkeypatch, present, missing_msg):
+    """Test error when 00_ready.json or 01_inputs.json is missing"""
     monkeypatch.chdir(tmp_path)
 
     run_id = "test_run_010"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
-    # Only create inputs, no ready file
-    inputs_data = {
-        "QUERY": "Test missing ready",
-        "ANALYSIS": "Synthesis",
-        "COCKTAIL": "PREMIUM",
-    }
-    with open(runs_dir / "01_inputs.json", "w") as f:
-        json.dump(inputs_data, f)
-
-    with pytest.raises(ActiveLLMError) as exc_info:
-        prepare_active_llms(run_id)
-
-    assert "Missing 00_ready.json" in str(exc_info.value)
-
-
-def test_missing_inputs_json_raises_error(tmp_path, monkeypatch):
-    """Test error when 01_inputs.json is missing"""
-    monkeypatch.chdir(tmp_path)
-
-    run_id = "test_run_011"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
-    # Only create ready, no inputs file
-    ready_data = {
-        "run_id": run_id,
-        "readyList": ["openai/gpt-4o"],
-        "status": "READY"
-    }
-    with open(runs_dir / "00_ready.json", "w") as f:
-        json.dump(ready_data, f)
+    # Create only one of the two prerequisite artifacts
+    if present == "00_ready.json":
+        make_run(run_id, ready_list=["openai/gpt-4o"])
+    else:
+        make_run(run_id, cocktail="PREMIUM", query="Test missing ready")
 
     with pytest.raises(ActiveLLMError) as exc_info:
         prepare_active_llms(run_id)
 
-    assert "Missing 01_inputs.json" in str(exc_info.value)
+    assert missing_msg in str(exc_info.value)
 
 
 def test_load_active_llms(tmp_path, monkeypatch):
@@ -332,25 +208,13 @@ def test_load_active_llms(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
     run_id = "test_run_012"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
     # Create prerequisites and prepare active LLMs
-    ready_data = {
-        "run_id": run_id,
-        "readyList": ["anthropic/claude-3.7-sonnet", "openai/gpt-4o", "google/gemini-2.5-pro"],
-        "status": "READY"
-    }
-    with open(runs_dir / "00_ready.json", "w") as f:
-        json.dump(ready_data, f)
-
-    inputs_data = {
-        "QUERY": "Test load",
-        "ANALYSIS": "Synthesis",
-        "COCKTAIL": "PREMIUM",
-    }
-    with open(runs_dir / "01_inputs.json", "w") as f:
-        json.dump(inputs_data, f)
+    make_run(
+        run_id,
+        ready_list=["anthropic/claude-3.7-sonnet", "openai/gpt-4o", "google/gemini-2.5-pro"],
+        cocktail="PREMIUM",
+        query="Test load",
+    )
 
     # Prepare
     original_result = prepare_active_llms(run_id)
@@ -369,24 +233,12 @@ def test_metadata_includes_run_id_and_phase(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
     run_id = "test_run_013"
-    runs_dir = Path(f"runs/{run_id}")
-    runs_dir.mkdir(parents=True)
-
-    ready_data = {
-        "run_id": run_id,
-        "readyList": ["openai/gpt-4o", "anthropic/claude-3.7-sonnet"],
-        "status": "READY"
-    }
-    with open(runs_dir / "00_ready.json", "w") as f:
-        json.dump(ready_data, f)
-
-    inputs_data = {
-        "QUERY": "Test metadata",
-        "ANALYSIS": "Synthesis",
-        "COCKTAIL": "DEPTH",
-    }
-    with open(runs_dir / "01_inputs.json", "w") as f:
-        json.dump(inputs_data, f)
+    make_run(
+        run_id,
+        ready_list=["openai/gpt-4o", "anthropic/claude-3.7-sonnet"],
+        cocktail="DEPTH",
+        query="Test metadata",
+    )
 
     result = prepare_active_llms(run_id)
 
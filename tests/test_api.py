@@ -1,12 +1,16 @@
 """
 Real integration tests for PR 11 API endpoints (NO MOCKS).
 """
+import asyncio
 import os
 import time
 import pytest
 from pathlib import Path
 
 import httpx
+from starlette.testclient import TestClient
+
+from ultrai import api
 
 
 skip_if_no_api_key = pytest.mark.skipif(
@@ -15,50 +19,62 @@ skip_if_no_api_key = pytest.mark.skipif(
 )
 
 
+@pytest.fixture(scope="module")
+def live_api():
+    """Keep-alive client for the running API server.
+
+    CI starts uvicorn server automatically
+    Local dev: uvicorn ultrai.api:app --port 8000
+    """
+    base = os.getenv("ULTRAI_API_BASE", "http://127.0.0.1:8000")
+    with httpx.Client(base_url=base, timeout=30) as client:
+        yield client
+
+
 @pytest.mark.pr11
 @skip_if_no_api_key
-def test_health_local_uvicorn(tmp_path, monkeypatch):
-    # CI starts uvicorn server automatically
-    # Local dev: uvicorn ultrai.api:app --port 8000
-    base = os.getenv("ULTRAI_API_BASE", "http://127.0.0.1:8000")
-    r = httpx.get(f"{base}/health")
+def test_health_local_uvicorn(live_api):
+    r = live_api.get("/health")
     assert r.status_code == 200
     assert r.json().get("status") == "ok"
 
 
 @pytest.mark.pr11
 @skip_if_no_api_key
-def test_runs_and_status_progress(monkeypatch):
-    # CI starts uvicorn server automatically
-    # Local dev: uvicorn ultrai.api:app --port 8000
-    base = os.getenv("ULTRAI_API_BASE", "http://127.0.0.1:8000")
-
+def test_runs_and_status_progress(live_api):
     # Start a real run
     payload = {"query": "What is 2+2?", "cocktail": "SPEEDY"}
-    r = httpx.post(f"{base}/runs", json=payload, timeout=30)
+    r = live_api.post("/runs", json=payload)
     assert r.status_code == 200
     run_id = r.json()["run_id"]
 
-    # Give the API a moment to start processing
-    time.sleep(2)
-
-    # Poll status until final or timeout
-    deadline = time.time() + 180
+    # Long-poll status until final or timeout: ?wait= returns as soon as
+    # progress changes; back off (0.25s -> 5s) only when a poll brings no news
+    deadline = time.monotonic() + 180
+    delay = 0.25
     last_phase = None
-    while time.time() < deadline:
-        s = httpx.get(f"{base}/runs/{run_id}/status", timeout=30)
+    last_update = None
+    while time.monotonic() < deadline:
+        s = live_api.get(
+            f"/runs/{run_id}/status", params={"wait": 30}, timeout=35
+        )
         assert s.status_code == 200
         data = s.json()
         last_phase = data.get("phase")
         if data.get("completed"):
             break
-        time.sleep(5)
+        if data.get("last_update") != last_update:
+            last_update = data.get("last_update")
+            delay = 0.25
+            continue
+        time.sleep(delay)
+        delay = min(delay * 1.5, 5.0)
 
     assert data.get("completed") is True, (
         f"Pipeline did not complete, last phase={last_phase}"
     )
     # Verify artifacts
-    a = httpx.get(f"{base}/runs/{run_id}/artifacts", timeout=30)
+    a = live_api.get(f"/runs/{run_id}/artifacts")
     assert a.status_code == 200
     files = a.json().get("files", [])
     required = [
@@ -72,3 +88,93 @@ def test_runs_and_status_progress(monkeypatch):
     present = {Path(f).name for f in files}
     for req in required:
         assert req in present, f"Missing artifact: {req}"
+
+
+@pytest.mark.pr11
+def test_status_wait_returns_immediately_for_completed_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    run_dir = tmp_path / "runs" / "test_wait_completed"
+    run_dir.mkdir(parents=True)
+    (run_dir / "05_ultrai.json").write_text("{}", encoding="utf-8")
+
+    with TestClient(api.app) as client:
+        start = time.monotonic()
+        r = client.get("/runs/test_wait_completed/status", params={"wait": 30})
+        elapsed = time.monotonic() - start
+
+    assert r.status_code == 200
+    assert r.json()["completed"] is True
+    assert elapsed < 5, "Completed runs must not be held by ?wait="
+
+
+@pytest.mark.pr11
+def test_status_wait_wakes_on_progress_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "runs" / "test_wait_progress").mkdir(parents=True)
+    api._update_progress("test_wait_progress", "Initializing UltrAI system", 3)
+
+    async def scenario():
+        poll = asyncio.create_task(api.run_status("test_wait_progress", wait=30))
+        await asyncio.sleep(0.1)
+        api._update_progress("test_wait_progress", "R1: Querying PRIMARY models", 30)
+        return await asyncio.wait_for(poll, timeout=5)
+
+    try:
+        response = asyncio.run(scenario())
+    finally:
+        api.progress_tracker.pop("test_wait_progress", None)
+
+    assert response.status_code == 200
+    assert b'"progress":30' in response.body
+
+
+@pytest.mark.pr11
+def test_status_wait_returns_immediately_for_failed_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    run_dir = tmp_path / "runs" / "test_wait_failed"
+    run_dir.mkdir(parents=True)
+    (run_dir / "error.txt").write_text("RuntimeError: boom", encoding="utf-8")
+    api._update_progress("test_wait_failed", "Error: RuntimeError", 0)
+
+    try:
+        with TestClient(api.app) as client:
+            start = time.monotonic()
+            r = client.get("/runs/test_wait_failed/status", params={"wait": 30})
+            elapsed = time.monotonic() - start
+    finally:
+        api.progress_tracker.pop("test_wait_failed", None)
+
+    assert r.status_code == 200
+    assert elapsed < 5, "Failed runs must not be held by ?wait="
+
+
+@pytest.mark.pr11
+def test_status_wait_returns_immediately_for_untracked_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "runs" / "test_wait_untracked").mkdir(parents=True)
+
+    with TestClient(api.app) as client:
+        start = time.monotonic()
+        r = client.get("/runs/test_wait_untracked/status", params={"wait": 30})
+        elapsed = time.monotonic() - start
+
+    assert r.status_code == 200
+    assert elapsed < 5, "Runs no longer tracked must not be held by ?wait="
+    assert "test_wait_untracked" not in api.run_change_events
+
+
+@pytest.mark.pr11
+def test_status_wait_timeout_drops_event(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(api, "MAX_STATUS_WAIT", 0.1)
+    (tmp_path / "runs" / "test_wait_timeout").mkdir(parents=True)
+    api._update_progress("test_wait_timeout", "Initializing UltrAI system", 3)
+
+    try:
+        response = asyncio.run(api.run_status("test_wait_timeout", wait=30))
+    finally:
+        api.progress_tracker.pop("test_wait_timeout", None)
+
+    assert response.status_code == 200
+    assert "test_wait_timeout" not in api.run_change_events
+    assert "test_wait_timeout" not in api.run_change_waiters
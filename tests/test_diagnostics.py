@@ -8,102 +8,105 @@ Shows exactly WHY each test didn't pass:
 - FAILED = Did not meet substantive objective (diagnostic info)
 """
 
+import bisect
 import pytest
-import time
-from typing import Dict, List
+import sys
 
 
 class TestDiagnostics:
     """Track why tests didn't pass"""
     
+    # Report sections, in display order
+    STATUS_TYPES = ("T-15", "T-30", "T-60", "T-120", "FAILED")
+    # Upper bounds (inclusive) of every timeout class but the last, in order
+    _TIMEOUT_BOUNDS = (15.0, 30.0, 60.0)
+    _TIMEOUT_CLASSES = ("T-15", "T-30", "T-60", "T-120")
+
+    __slots__ = ("results", "timeout_threshold", "_by_type", "_type_of")
+    
     def __init__(self):
-        self.results: Dict[str, str] = {}
+        self.results: dict[str, str] = {}
         self.timeout_threshold = 30.0
+        # Bucketed as recorded: status type -> {test_name: reason}
+        self._by_type: dict[str, dict[str, str]] = {t: {} for t in self.STATUS_TYPES}
+        self._type_of: dict[str, str] = {}
     
     def set_timeout(self, timeout: float):
         """Set timeout threshold"""
         self.timeout_threshold = timeout
     
+    def _record(self, status_type: str, test_name: str, reason: str):
+        """Store a result under its status type (a re-record replaces it)"""
+        previous = self._type_of.get(test_name)
+        if previous is not None and previous != status_type:
+            del self._by_type[previous][test_name]
+        self._type_of[test_name] = status_type
+        self._by_type[status_type][test_name] = reason
+        self.results[test_name] = reason
+    
     def record_timeout(self, test_name: str, duration: float):
         """Record a timeout with diagnostic info"""
         timeout_class = self._get_timeout_class(duration)
-        self.results[test_name] = f"{timeout_class} (timed out after {duration:.1f}s)"
+        self._record(timeout_class, test_name, f"{timeout_class} (timed out after {duration:.1f}s)")
     
     def record_failure(self, test_name: str, reason: str):
         """Record a failure with diagnostic info"""
-        self.results[test_name] = f"FAILED ({reason})"
+        self._record("FAILED", test_name, f"FAILED ({reason})")
     
     def _get_timeout_class(self, duration: float) -> str:
         """Get timeout class"""
-        if duration <= 15.0:
-            return "T-15"
-        elif duration <= 30.0:
-            return "T-30"
-        elif duration <= 60.0:
-            return "T-60"
-        else:
-            return "T-120"
+        return self._TIMEOUT_CLASSES[bisect.bisect_left(self._TIMEOUT_BOUNDS, duration)]
     
     def get_diagnostics(self) -> str:
         """Get diagnostic summary"""
         if not self.results:
             return "✅ All tests passed or were intentionally skipped"
         
-        summary = f"🔍 Test Diagnostics: {len(self.results)} tests didn't pass\n"
-        summary += "=" * 60 + "\n"
-        
-        by_type = {}
-        for test_name, reason in self.results.items():
-            if reason.startswith("T-"):
-                timeout_class = reason.split()[0]
-                if timeout_class not in by_type:
-                    by_type[timeout_class] = []
-                by_type[timeout_class].append(f"{test_name}: {reason}")
-            else:
-                if "FAILED" not in by_type:
-                    by_type["FAILED"] = []
-                by_type["FAILED"].append(f"{test_name}: {reason}")
+        parts: list[str] = [
+            f"🔍 Test Diagnostics: {len(self.results)} tests didn't pass\n",
+            "=" * 60 + "\n",
+        ]
         
-        for status_type in ["T-15", "T-30", "T-60", "T-120", "FAILED"]:
-            if status_type in by_type:
-                tests = by_type[status_type]
-                summary += f"\n{status_type} ({len(tests)} tests):\n"
-                for test in tests:
-                    summary += f"  - {test}\n"
+        for status_type in self.STATUS_TYPES:
+            tests = self._by_type[status_type]
+            if tests:
+                parts.append(f"\n{status_type} ({len(tests)} tests):\n")
+                parts.extend(
+                    f"  - {test_name}: {reason}\n"
+                    for test_name, reason in tests.items()
+                )
         
-        return summary
+        return "".join(parts)
 
 
 # Global diagnostics instance
 diagnostics = TestDiagnostics()
 
 
-def pytest_runtest_setup(item):
-    """Track test start"""
-    item._start_time = time.time()
-
-
-def pytest_runtest_teardown(item, nextitem):
-    """Record why test didn't pass"""
-    if hasattr(item, '_start_time'):
-        duration = time.time() - item._start_time
-        if duration > diagnostics.timeout_threshold:
-            diagnostics.record_timeout(item.name, duration)
-
-
 def pytest_runtest_logreport(report):
-    """Record test failures with reasons"""
+    """Record slow tests (pytest's own call timing) and failures with reasons"""
+    if report.when == "call" and report.duration > diagnostics.timeout_threshold:
+        diagnostics.record_timeout(report.nodeid.rpartition('::')[2], report.duration)
     if report.failed and not report.skipped:
         # Extract failure reason from report
         reason = "Unknown error"
-        if hasattr(report, 'longrepr') and report.longrepr:
-            reason = str(report.longrepr).split('\n')[0][:100]
+        longrepr = getattr(report, 'longrepr', None)
+        if longrepr:
+            # reprcrash holds the exception line, so the full traceback is
+            # only rendered for reports without one (e.g. plain-text longrepr)
+            crash = getattr(longrepr, 'reprcrash', None)
+            text = crash.message if crash is not None else str(longrepr)
+            reason = text.partition('\n')[0][:100]
         diagnostics.record_failure(report.nodeid, reason)
 
 
 def pytest_sessionfinish(session, exitstatus):
-    """Show diagnostic summary"""
-    print("\n" + diagnostics.get_diagnostics())
+    """Show diagnostic summary (nothing on a clean run)"""
+    if not diagnostics.results:
+        return
+    # One write for the whole report rather than print's per-line flushes
+    sys.stdout.write(f"\n{diagnostics.get_diagnostics()}\n")
+    sys.stdout.flush()
 
 
 def set_timeout_threshold(timeout: float):
@@ -31,22 +31,50 @@ skip_if_no_api_key = pytest.mark.skipif(
 
 
 @pytest.mark.pr03
-def test_all_cocktails_have_3_primary_models():
-    """Verify all cocktails have exactly 3 PRIMARY models"""
-    for cocktail_name, models in PRIMARY_MODELS.items():
-        assert len(models) == 3, (
-            f"{cocktail_name} must have exactly 3 PRIMARY models, "
-            f"found {len(models)}: {models}"
-        )
+@pytest.mark.parametrize("cocktail", list(PRIMARY_MODELS))
+def test_cocktail_model_invariants(cocktail):
+    """
+    Verify each cocktail's PRIMARY/FALLBACK invariants in one pass:
+    exactly 3 of each, no duplicates within either list, 1:1 string
+    correspondence, and no model in both PRIMARY and FALLBACK.
+    """
+    primary_list = PRIMARY_MODELS[cocktail]
+    fallback_list = FALLBACK_MODELS.get(cocktail, [])
+    primary_set = set(primary_list)
+    fallback_set = set(fallback_list)
+
+    assert len(primary_list) == 3, (
+        f"{cocktail} must have exactly 3 PRIMARY models, "
+        f"found {len(primary_list)}: {primary_list}"
+    )
+    assert len(fallback_list) == 3, (
+        f"{cocktail} must have exactly 3 FALLBACK models, "
+        f"found {len(fallback_list)}: {fallback_list}"
+    )
+    assert len(primary_set) == len(primary_list), (
+        f"{cocktail} PRIMARY has duplicate models: {primary_list}"
+    )
+    assert len(fallback_set) == len(fallback_list), (
+        f"{cocktail} FALLBACK has duplicate models: {fallback_list}"
+    )
 
+    # CRITICAL: a failed PRIMARY must never be retried as its own FALLBACK,
+    # e.g. "Primary failed (Rate limited), Backup failed (Rate limited)"
+    duplicates = primary_set & fallback_set
+    assert not duplicates, (
+        f"{cocktail} has models in BOTH PRIMARY and FALLBACK: {duplicates}\n"
+        f"PRIMARY: {primary_list}\n"
+        f"FALLBACK: {fallback_list}\n"
+        "This causes the backup system to retry the same failed model!"
+    )
 
-@pytest.mark.pr03
-def test_all_cocktails_have_3_fallback_models():
-    """Verify all cocktails have exactly 3 FALLBACK models"""
-    for cocktail_name, models in FALLBACK_MODELS.items():
-        assert len(models) == 3, (
-            f"{cocktail_name} must have exactly 3 FALLBACK models, "
-            f"found {len(models)}: {models}"
+    # FALLBACK[i] stands in for PRIMARY[i]
+    for i, (primary, fallback) in enumerate(zip(primary_list, fallback_list)):
+        assert isinstance(primary, str), (
+            f"{cocktail} PRIMARY[{i}] must be a string"
+        )
+        assert isinstance(fallback, str), (
+            f"{cocktail} FALLBACK[{i}] must be a string"
         )
 
 
@@ -79,26 +107,6 @@ def test_primary_timeout_and_attempts_configured():
     )
 
 
-@pytest.mark.pr03
-def test_no_duplicate_models_in_primary():
-    """Verify no duplicate models within each PRIMARY cocktail"""
-    for cocktail_name, models in PRIMARY_MODELS.items():
-        unique_models = set(models)
-        assert len(unique_models) == len(models), (
-            f"{cocktail_name} PRIMARY has duplicate models: {models}"
-        )
-
-
-@pytest.mark.pr03
-def test_no_duplicate_models_in_fallback():
-    """Verify no duplicate models within each FALLBACK cocktail"""
-    for cocktail_name, models in FALLBACK_MODELS.items():
-        unique_models = set(models)
-        assert len(unique_models) == len(models), (
-            f"{cocktail_name} FALLBACK has duplicate models: {models}"
-        )
-
-
 @skip_if_no_api_key
 @pytest.mark.pr04
 @pytest.mark.asyncio
@@ -110,7 +118,6 @@ async def test_failed_models_tracked_in_initial_round(tmp_path, monkeypatch):
     which enables the fallback logic to work correctly.
     """
     monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY"))
 
     # Setup
     ready_result = await check_system_readiness()
@@ -151,28 +158,15 @@ async def test_failed_models_tracked_in_initial_round(tmp_path, monkeypatch):
 
 @skip_if_no_api_key
 @pytest.mark.pr04
-@pytest.mark.asyncio
-async def test_backup_list_loaded_from_activate(tmp_path, monkeypatch):
+def test_backup_list_loaded_from_activate(speedy_activation):
     """
     Verify that backupList (FALLBACK models) is loaded from 02_activate.json.
 
     This confirms the activation phase correctly identifies which FALLBACK
     models are available for use during R1 execution.
     """
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY"))
-
-    # Setup
-    ready_result = await check_system_readiness()
-    run_id = ready_result['run_id']
-
-    collect_user_inputs(
-        query="Test query",
-        cocktail="SPEEDY",
-        run_id=run_id
-    )
-
-    activate_result = prepare_active_llms(run_id)
+    # Setup: shared real SPEEDY run (readiness + inputs + activation)
+    activate_result = speedy_activation["activation"]
 
     # Verify backupList exists in activation result
     assert "backupList" in activate_result, (
@@ -182,16 +176,10 @@ async def test_backup_list_loaded_from_activate(tmp_path, monkeypatch):
         "backupList must be a list"
     )
 
-    # Verify backupList is saved to artifact
-    runs_dir = Path(f"runs/{run_id}")
-    activate_path = runs_dir / "02_activate.json"
-
-    with open(activate_path, "r") as f:
-        activate_data = json.load(f)
-
-    assert "backupList" in activate_data, (
-        "02_activate.json artifact must include backupList"
-    )
+    # Verify the artifact was written; prepare_active_llms writes exactly
+    # the dict it returns, so backupList is checked on activate_result
+    activate_path = speedy_activation["runs_dir"] / "02_activate.json"
+    assert activate_path.is_file(), "02_activate.json must exist"
 
     # Verify backupList contains models from FALLBACK_MODELS for selected cocktail
     cocktail = activate_result["cocktail"]
@@ -206,52 +194,3 @@ async def test_backup_list_loaded_from_activate(tmp_path, monkeypatch):
         assert backup in expected_fallbacks, (
             f"Backup model '{backup}' should be in {cocktail} FALLBACK_MODELS"
         )
-
-
-@pytest.mark.pr03
-def test_no_model_in_both_primary_and_fallback():
-    """
-    CRITICAL: Verify no model appears in both PRIMARY and FALLBACK for same cocktail.
-
-    This prevents the bug where a failed PRIMARY model is retried as its own FALLBACK,
-    causing errors like:
-    "Primary failed (Rate limited), Backup failed (Rate limited)"
-    for the same model.
-    """
-    for cocktail_name in PRIMARY_MODELS.keys():
-        primary_set = set(PRIMARY_MODELS[cocktail_name])
-        fallback_set = set(FALLBACK_MODELS[cocktail_name])
-
-        duplicates = primary_set & fallback_set
-        assert len(duplicates) == 0, (
-            f"{cocktail_name} has models in BOTH PRIMARY and FALLBACK: {duplicates}\n"
-            f"PRIMARY: {PRIMARY_MODELS[cocktail_name]}\n"
-            f"FALLBACK: {FALLBACK_MODELS[cocktail_name]}\n"
-            "This causes the backup system to retry the same failed model!"
-        )
-
-
-@pytest.mark.pr03
-def test_fallback_model_correspondence():
-    """
-    Verify 1:1 correspondence between PRIMARY and FALLBACK models.
-
-    Each PRIMARY model at index i should have a corresponding FALLBACK
-    model at index i in the FALLBACK list.
-    """
-    for cocktail_name in PRIMARY_MODELS.keys():
-        primary_list = PRIMARY_MODELS[cocktail_name]
-        fallback_list = FALLBACK_MODELS[cocktail_name]
-
-        for i in range(len(primary_list)):
-            primary = primary_list[i]
-            fallback = fallback_list[i]
-
-            # Fallback should be different from primary (to provide alternative)
-            # (unless no alternative exists, which is rare)
-            assert isinstance(primary, str), (
-                f"{cocktail_name} PRIMARY[{i}] must be a string"
-            )
-            assert isinstance(fallback, str), (
-                f"{cocktail_name} FALLBACK[{i}] must be a string"
-            )
@@ -9,13 +9,12 @@ Testing Endpoints (from PR 09 template):
 3. Delivery manifest correctly lists all artifacts
 """
 
+import asyncio
 import os
+import shutil
 from pathlib import Path
 import pytest
 
-from ultrai.system_readiness import check_system_readiness
-from ultrai.user_input import collect_user_inputs
-from ultrai.active_llms import prepare_active_llms
 from ultrai.initial_round import execute_initial_round
 from ultrai.meta_round import execute_meta_round
 from ultrai.ultrai_synthesis import execute_ultrai_synthesis
@@ -33,27 +32,52 @@ skip_if_no_api_key = pytest.mark.skipif(
     reason="OPENROUTER_API_KEY not set",
 )
 
+# Files a completed delivery leaves under runs/<run_id>/
+DELIVERED_ARTIFACTS = (
+    "05_ultrai.json",
+    "03_initial.json",
+    "04_meta.json",
+    "stats.json",
+    "delivery.json",
+)
 
-@skip_if_no_api_key
-@pytest.mark.asyncio
-async def test_all_required_artifacts_exist(tmp_path, monkeypatch):
-    """Test that all required artifacts exist after full pipeline."""
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY"))
-
-    # Run full pipeline
-    ready = await check_system_readiness()
-    run_id = ready["run_id"]
-
-    collect_user_inputs(
-        query="Full pipeline test",
-        cocktail="SPEEDY",
-        run_id=run_id,
-    )
-    prepare_active_llms(run_id)
+
+async def _run_through_synthesis(run_id: str) -> None:
+    """Run the real pipeline from 02_activate.json up to 05_ultrai.json"""
     await execute_initial_round(run_id)
     await execute_meta_round(run_id)
     await execute_ultrai_synthesis(run_id)
+
+
+@pytest.fixture(scope="module")
+def synthesized_run(speedy_activation, tmp_path_factory):
+    """Real pipeline run through synthesis, made once per module.
+
+    Continues from a copy of the shared SPEEDY activation. Delivery only
+    reads artifacts, so every API test starts from a copy of this run
+    instead of paying for its own R1/R2/R3 calls.
+    """
+    root = tmp_path_factory.mktemp("pipeline")
+    run_id = speedy_activation["run_id"]
+    shutil.copytree(speedy_activation["runs_dir"], root / "runs" / run_id)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(root)
+        asyncio.run(_run_through_synthesis(run_id))
+    return root / "runs" / run_id
+
+
+@pytest.fixture
+def pipeline_run(synthesized_run, tmp_path, monkeypatch):
+    """Private copy of the synthesized run under tmp_path; returns run_id"""
+    monkeypatch.chdir(tmp_path)
+    shutil.copytree(synthesized_run, Path("runs") / synthesized_run.name)
+    return synthesized_run.name
+
+
+@skip_if_no_api_key
+def test_all_required_artifacts_exist(pipeline_run):
+    """Test that all required artifacts exist after full pipeline."""
+    run_id = pipeline_run
     generate_statistics(run_id)
 
     # Deliver results
@@ -64,34 +88,18 @@ async def test_all_required_artifacts_exist(tmp_path, monkeypatch):
     assert len(delivery["missing_required"]) == 0
 
     # Verify specific artifacts
-    runs_dir = Path(f"runs/{run_id}")
-    assert (runs_dir / "05_ultrai.json").exists()
-    assert (runs_dir / "03_initial.json").exists()
-    assert (runs_dir / "04_meta.json").exists()
-    assert (runs_dir / "stats.json").exists()
-    assert (runs_dir / "delivery.json").exists()
+    runs_dir = Path("runs", run_id)
+    missing = [
+        name for name in DELIVERED_ARTIFACTS
+        if not (runs_dir / name).is_file()
+    ]
+    assert not missing, f"Missing artifacts: {missing}"
 
 
 @skip_if_no_api_key
-@pytest.mark.asyncio
-async def test_delivery_manifest_structure(tmp_path, monkeypatch):
+def test_delivery_manifest_structure(pipeline_run):
     """Test that delivery manifest has correct structure."""
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY"))
-
-    # Run full pipeline
-    ready = await check_system_readiness()
-    run_id = ready["run_id"]
-
-    collect_user_inputs(
-        query="Manifest test",
-        cocktail="SPEEDY",
-        run_id=run_id,
-    )
-    prepare_active_llms(run_id)
-    await execute_initial_round(run_id)
-    await execute_meta_round(run_id)
-    await execute_ultrai_synthesis(run_id)
+    run_id = pipeline_run
     generate_statistics(run_id)
 
     delivery = deliver_results(run_id)
@@ -112,25 +120,9 @@ async def test_delivery_manifest_structure(tmp_path, monkeypatch):
 
 
 @skip_if_no_api_key
-@pytest.mark.asyncio
-async def test_load_synthesis_returns_ultrai(tmp_path, monkeypatch):
+def test_load_synthesis_returns_ultrai(pipeline_run):
     """Test that load_synthesis returns the synthesis artifact."""
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY"))
-
-    # Run pipeline
-    ready = await check_system_readiness()
-    run_id = ready["run_id"]
-
-    collect_user_inputs(
-        query="Load synthesis test",
-        cocktail="SPEEDY",
-        run_id=run_id,
-    )
-    prepare_active_llms(run_id)
-    await execute_initial_round(run_id)
-    await execute_meta_round(run_id)
-    await execute_ultrai_synthesis(run_id)
+    run_id = pipeline_run
 
     # Load synthesis
     synthesis = load_synthesis(run_id)
@@ -143,27 +135,9 @@ async def test_load_synthesis_returns_ultrai(tmp_path, monkeypatch):
 
 
 @skip_if_no_api_key
-@pytest.mark.asyncio
-async def test_load_all_artifacts_returns_complete_package(
-    tmp_path, monkeypatch
-):
+def test_load_all_artifacts_returns_complete_package(pipeline_run):
     """Test that load_all_artifacts returns all deliverables."""
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY"))
-
-    # Run full pipeline
-    ready = await check_system_readiness()
-    run_id = ready["run_id"]
-
-    collect_user_inputs(
-        query="Load all test",
-        cocktail="SPEEDY",
-        run_id=run_id,
-    )
-    prepare_active_llms(run_id)
-    await execute_initial_round(run_id)
-    await execute_meta_round(run_id)
-    await execute_ultrai_synthesis(run_id)
+    run_id = pipeline_run
     generate_statistics(run_id)
     deliver_results(run_id)
 
@@ -211,27 +185,9 @@ def test_missing_synthesis_raises_error(tmp_path, monkeypatch):
 
 
 @skip_if_no_api_key
-@pytest.mark.asyncio
-async def test_delivery_status_incomplete_when_missing_artifacts(
-    tmp_path, monkeypatch
-):
+def test_delivery_status_incomplete_when_missing_artifacts(pipeline_run):
     """Test that delivery status is INCOMPLETE when artifacts missing."""
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY"))
-
-    # Run partial pipeline (missing final and stats)
-    ready = await check_system_readiness()
-    run_id = ready["run_id"]
-
-    collect_user_inputs(
-        query="Partial pipeline",
-        cocktail="SPEEDY",
-        run_id=run_id,
-    )
-    prepare_active_llms(run_id)
-    await execute_initial_round(run_id)
-    await execute_meta_round(run_id)
-    await execute_ultrai_synthesis(run_id)
+    run_id = pipeline_run
     # Intentionally skip addons and stats
 
     # Deliver (should be incomplete)
@@ -243,25 +199,9 @@ async def test_delivery_status_incomplete_when_missing_artifacts(
 
 
 @skip_if_no_api_key
-@pytest.mark.asyncio
-async def test_artifact_size_tracking(tmp_path, monkeypatch):
+def test_artifact_size_tracking(pipeline_run):
     """Test that artifact sizes are tracked in delivery manifest."""
-    monkeypatch.chdir(tmp_path)
-    monkeypatch.setenv("OPENROUTER_API_KEY", os.getenv("OPENROUTER_API_KEY"))
-
-    # Run full pipeline
-    ready = await check_system_readiness()
-    run_id = ready["run_id"]
-
-    collect_user_inputs(
-        query="Size tracking test",
-        cocktail="SPEEDY",
-        run_id=run_id,
-    )
-    prepare_active_llms(run_id)
-    await execute_initial_round(run_id)
-    await execute_meta_round(run_id)
-    await execute_ultrai_synthesis(run_id)
+    run_id = pipeline_run
     generate_statistics(run_id)
 
     delivery = deliver_results(run_id)
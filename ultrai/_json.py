@@ -0,0 +1,29 @@
+"""
+Shared JSON encode/decode for UltrAI artifacts.
+
+Uses orjson when it is installed (the `perf` extra) and falls back to the
+stdlib json module otherwise.
+
+- loads(data): parse bytes or str
+- dumps(obj): 2-space indented UTF-8 bytes
+
+The two backends write the same bytes for the payloads UltrAI produces
+(str keys; string, int, bool, null and non-exponent float values). They
+differ outside that shape: orjson writes 1e20 where json writes 1e+20,
+writes NaN/Infinity as null, and raises TypeError on non-str dict keys.
+"""
+
+import json
+
+try:
+    import orjson  # optional: faster artifact encode/decode
+
+    loads = orjson.loads
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
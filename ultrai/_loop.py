@@ -0,0 +1,22 @@
+"""
+Event-loop runner for UltrAI's command-line scripts.
+
+run_main(coro) runs the coroutine on uvloop's libuv-based loop when uvloop is
+installed (the `perf` extra) and the platform supports it. Otherwise it uses
+asyncio.run.
+"""
+
+import asyncio
+import sys
+
+try:
+    import uvloop  # optional: libuv-backed event loop
+except ImportError:
+    uvloop = None
+
+
+def run_main(coro):
+    """Run coro to completion on the fastest available event loop"""
+    if uvloop is not None and sys.platform != "win32":
+        return uvloop.run(coro)
+    return asyncio.run(coro)
@@ -12,10 +12,11 @@ Requires quorum of at least 2 ACTIVE models to proceed.
 Creates artifact: runs/<RunID>/02_activate.json
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
+
+from ultrai._json import dumps as _dumps, loads as _loads
 
 
 class ActiveLLMError(Exception):
@@ -106,57 +107,24 @@ BACKUP_MODELS = FALLBACK_MODELS
 QUORUM = 2
 
 
-def prepare_active_llms(run_id: str) -> Dict:
+def prepare_active_llms_from(ready_list: List[str], cocktail: str) -> Dict:
     """
-    Prepare ACTIVE LLMs by finding intersection of READY and COCKTAIL.
+    Select ACTIVE LLMs for a cocktail from an in-memory READY list.
 
-    Reads:
-    - runs/<run_id>/00_ready.json (for readyList)
-    - runs/<run_id>/01_inputs.json (for COCKTAIL choice)
-
-    Creates:
-    - runs/<run_id>/02_activate.json (with activeList)
+    Pure counterpart of prepare_active_llms: no artifacts are read or
+    written, and no run metadata is attached.
 
     Args:
-        run_id: The run ID to process
+        ready_list: READY model identifiers (readyList of 00_ready.json)
+        cocktail: Selected cocktail name (COCKTAIL of 01_inputs.json)
 
     Returns:
-        Dictionary containing:
-        - activeList: List of ACTIVE LLM identifiers
-        - quorum: Required minimum (always 2)
-        - cocktail: Selected cocktail name
-        - reasons: Dict explaining status of each cocktail model
-        - metadata: Run metadata
+        Dictionary containing activeList, backupList, quorum, cocktail
+        and reasons
 
     Raises:
-        ActiveLLMError: If quorum not met or files missing
+        ActiveLLMError: If the cocktail is unknown or quorum not met
     """
-    runs_dir = Path(f"runs/{run_id}")
-
-    # Load readyList from 00_ready.json
-    ready_path = runs_dir / "00_ready.json"
-    if not ready_path.exists():
-        raise ActiveLLMError(
-            f"Missing 00_ready.json for run_id: {run_id}. "
-            "Run system readiness check first."
-        )
-
-    with open(ready_path, "r", encoding="utf-8") as f:
-        ready_data = json.load(f)
-        ready_list = ready_data.get("readyList", [])
-
-    # Load COCKTAIL from 01_inputs.json
-    inputs_path = runs_dir / "01_inputs.json"
-    if not inputs_path.exists():
-        raise ActiveLLMError(
-            f"Missing 01_inputs.json for run_id: {run_id}. "
-            "Collect user inputs first."
-        )
-
-    with open(inputs_path, "r", encoding="utf-8") as f:
-        inputs_data = json.load(f)
-        cocktail = inputs_data.get("COCKTAIL")
-
     if not cocktail:
         raise ActiveLLMError("COCKTAIL not found in 01_inputs.json")
 
@@ -256,24 +224,71 @@ def prepare_active_llms(run_id: str) -> Dict:
             "Low pluralism warning."
         )
 
-    # Build result
-    result = {
+    return {
         "activeList": active_list,
         "backupList": backup_list,  # NEW: Backup models for fast-fail recovery
         "quorum": QUORUM,
         "cocktail": cocktail,
         "reasons": reasons,
-        "metadata": {
-            "run_id": run_id,
-            "timestamp": datetime.now().isoformat(),
-            "phase": "02_activate"
-        }
+    }
+
+
+def prepare_active_llms(run_id: str) -> Dict:
+    """
+    Prepare ACTIVE LLMs by finding intersection of READY and COCKTAIL.
+
+    Reads:
+    - runs/<run_id>/00_ready.json (for readyList)
+    - runs/<run_id>/01_inputs.json (for COCKTAIL choice)
+
+    Creates:
+    - runs/<run_id>/02_activate.json (with activeList)
+
+    Args:
+        run_id: The run ID to process
+
+    Returns:
+        Dictionary containing:
+        - activeList: List of ACTIVE LLM identifiers
+        - quorum: Required minimum (always 2)
+        - cocktail: Selected cocktail name
+        - reasons: Dict explaining status of each cocktail model
+        - metadata: Run metadata
+
+    Raises:
+        ActiveLLMError: If quorum not met or files missing
+    """
+    runs_dir = Path(f"runs/{run_id}")
+
+    # Load readyList from 00_ready.json (one open; no separate exists())
+    try:
+        ready_data = _loads((runs_dir / "00_ready.json").read_bytes())
+    except FileNotFoundError:
+        raise ActiveLLMError(
+            f"Missing 00_ready.json for run_id: {run_id}. "
+            "Run system readiness check first."
+        ) from None
+    ready_list = ready_data.get("readyList", [])
+
+    # Load COCKTAIL from 01_inputs.json
+    try:
+        inputs_data = _loads((runs_dir / "01_inputs.json").read_bytes())
+    except FileNotFoundError:
+        raise ActiveLLMError(
+            f"Missing 01_inputs.json for run_id: {run_id}. "
+            "Collect user inputs first."
+        ) from None
+    cocktail = inputs_data.get("COCKTAIL")
+
+    result = prepare_active_llms_from(ready_list, cocktail)
+    result["metadata"] = {
+        "run_id": run_id,
+        "timestamp": datetime.now().isoformat(),
+        "phase": "02_activate"
     }
 
     # Create artifact
-    artifact_path = runs_dir / "02_activate.json"
-    with open(artifact_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
+    (runs_dir / "02_activate.json").write_bytes(_dumps(result))
 
     return result
 
@@ -298,8 +313,7 @@ def load_active_llms(run_id: str) -> Dict:
             f"No active LLMs data found for run_id: {run_id}"
         )
 
-    with open(artifact_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _loads(artifact_path.read_bytes())
 
 
 def main():
@@ -3,6 +3,7 @@ Public API (PR 11) - FastAPI endpoints exposing UltrAI orchestration.
 Endpoints:
 - POST /runs                -> start orchestration (PR01→PR06), return run_id
 - GET  /runs/{run_id}/status -> current phase, artifacts, completion flag
+                                (?wait=N long-polls until progress changes)
 - GET  /runs/{run_id}/artifacts -> list available artifact files
 - GET  /health              -> 200 OK
 """
@@ -46,6 +47,15 @@ app.add_middleware(
 # Maps run_id -> {step: str, percentage: int, last_update: str}
 progress_tracker: Dict[str, Dict] = {}
 
+# Long-poll support for GET /runs/{run_id}/status?wait=N
+# Maps run_id -> Event set (and discarded) on the next progress change
+run_change_events: Dict[str, asyncio.Event] = {}
+# Maps run_id -> number of long-polls currently waiting on its Event
+run_change_waiters: Dict[str, int] = {}
+
+# Upper bound for the ?wait= long-poll, in seconds
+MAX_STATUS_WAIT = 30.0
+
 
 class _RunLogger(logging.LoggerAdapter):
     def process(self, msg, kwargs):  # type: ignore[override]
@@ -232,6 +242,13 @@ def _build_runs_dir(run_id: str) -> Path:
     return safe_run_dir
 
 
+def _notify_run_change(run_id: str) -> None:
+    """Wake any status long-polls waiting on this run."""
+    event = run_change_events.pop(run_id, None)
+    if event is not None:
+        event.set()
+
+
 def _update_progress(run_id: str, step: str, percentage: int) -> None:
     """
     Update progress tracking for real-time UX feedback.
@@ -260,6 +277,7 @@ def _update_progress(run_id: str, step: str, percentage: int) -> None:
     # Update overall percentage
     progress_tracker[run_id]["percentage"] = percentage
     progress_tracker[run_id]["last_update"] = datetime.now().isoformat()
+    _notify_run_change(run_id)
 
 
 def _complete_progress_step(run_id: str, step_text: str, time_sec: float = None) -> None:
@@ -282,6 +300,7 @@ def _complete_progress_step(run_id: str, step_text: str, time_sec: float = None)
             break
 
     progress_tracker[run_id]["last_update"] = datetime.now().isoformat()
+    _notify_run_change(run_id)
 
 
 def _prepopulate_model_steps(run_id: str) -> None:
@@ -497,6 +516,7 @@ async def _orchestrate_pipeline(
         # Clean up progress tracker after completion
         if run_id in progress_tracker:
             del progress_tracker[run_id]
+        _notify_run_change(run_id)
 
         # Emit run complete event with total time
         _write_event(run_id, {
@@ -531,6 +551,8 @@ async def _orchestrate_pipeline(
             # Silently ignore if we can't write error file
             # This prevents cascading failures during error handling
             pass
+        # Wake long-polls again so they see error.txt and stop waiting
+        _notify_run_change(run_id)
 
 
 @app.get("/health")
@@ -601,13 +623,42 @@ def _current_phase(validated_run_dir: Path) -> Optional[str]:
 
 
 @app.get("/runs/{run_id}/status")
-async def run_status(run_id: str) -> JSONResponse:
+async def run_status(run_id: str, wait: float = 0) -> JSONResponse:
+    """
+    Report run status. With ?wait=N (seconds, capped at MAX_STATUS_WAIT),
+    a run still in progress is held open until its progress changes or N
+    elapses, so clients can long-poll instead of sleeping between requests.
+    Completed, failed and untracked runs are answered immediately.
+    """
     # SAFE: _build_runs_dir validates run_id and ensures path is within runs/
     validated_run_dir = _build_runs_dir(run_id)
     # lgtm[py/path-injection]
     if not validated_run_dir.exists():
         raise HTTPException(status_code=404, detail="run_id not found")
 
+    # SAFE: literal filenames appended to validated path
+    # lgtm[py/path-injection]
+    # Only runs still tracked in this process can change; finished, failed
+    # and untracked (e.g. pre-restart) runs are answered immediately
+    if wait > 0 and run_id in progress_tracker and not (
+        (validated_run_dir / "05_ultrai.json").exists()
+        or (validated_run_dir / "06_final.json").exists()
+        or (validated_run_dir / "error.txt").exists()
+    ):
+        event = run_change_events.setdefault(run_id, asyncio.Event())
+        run_change_waiters[run_id] = run_change_waiters.get(run_id, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), min(wait, MAX_STATUS_WAIT))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            run_change_waiters[run_id] -= 1
+            if not run_change_waiters[run_id]:
+                del run_change_waiters[run_id]
+                # Last waiter gone: drop an Event nothing will set
+                if run_change_events.get(run_id) is event:
+                    del run_change_events[run_id]
+
     # Determine phase by highest artifact present
     phase_file = _current_phase(validated_run_dir)
     # SAFE: glob with literal pattern on validated path
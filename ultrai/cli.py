@@ -531,7 +531,7 @@ async def main():
             # Define progress callback for R1
             def r1_progress(model, time_sec, total, completed):
                 # Extract short model name (last part after /)
-                short_name = model.split('/')[-1] if '/' in model else model
+                short_name = model.rsplit('/', 1)[-1]
                 progress_line = (
                     f"{NEON_GREEN}{BOLD}  ✓{RESET} "
                     f"{WHITE}{short_name}{RESET} "
@@ -629,7 +629,7 @@ async def main():
             # Define progress callback for R2
             def r2_progress(model, time_sec, total, completed):
                 # Extract short model name (last part after /)
-                short_name = model.split('/')[-1] if '/' in model else model
+                short_name = model.rsplit('/', 1)[-1]
                 progress_line = (
                     f"{NEON_GREEN}{BOLD}  ✓{RESET} "
                     f"{WHITE}{short_name}{RESET} "
@@ -21,11 +21,12 @@ Creates:
 - runs/<run_id>/delivery.json (delivery manifest with paths and status)
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List
 
+from ultrai._json import dumps as _dumps, loads as _loads
+
 
 class FinalDeliveryError(Exception):
     """Raised when final delivery fails"""
@@ -77,8 +78,7 @@ def deliver_results(run_id: str) -> Dict:
         if artifact_path.exists():
             # Load artifact to verify it's valid JSON
             try:
-                with open(artifact_path, "r", encoding="utf-8") as f:
-                    json.load(f)  # Validate JSON format
+                _loads(artifact_path.read_bytes())  # Validate JSON format
 
                 artifacts.append({
                     "name": artifact_name,
@@ -138,8 +138,7 @@ def deliver_results(run_id: str) -> Dict:
 
     # Write delivery manifest
     delivery_path = runs_dir / "delivery.json"
-    with open(delivery_path, "w", encoding="utf-8") as f:
-        json.dump(delivery, f, indent=2, ensure_ascii=False)
+    delivery_path.write_bytes(_dumps(delivery))
 
     return delivery
 
@@ -159,8 +158,7 @@ def load_synthesis(run_id: str) -> Dict:
             f"Synthesis not found: {ultrai_path}"
         )
 
-    with open(ultrai_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _loads(ultrai_path.read_bytes())
 
 
 def load_all_artifacts(run_id: str) -> Dict:
@@ -191,8 +189,7 @@ def load_all_artifacts(run_id: str) -> Dict:
     for key, filename in artifact_files.items():
         artifact_path = runs_dir / filename
         if artifact_path.exists():
-            with open(artifact_path, "r", encoding="utf-8") as f:
-                artifacts[key] = json.load(f)
+            artifacts[key] = _loads(artifact_path.read_bytes())
         else:
             artifacts[key] = None
 